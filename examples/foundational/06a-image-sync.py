@@ -6,13 +6,22 @@
 
 import asyncio
 import aiohttp
+import mmap
 import os
 import sys
 
+from typing import Tuple
+
 from PIL import Image
 
 from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.frames.frames import Frame, OutputImageRawFrame, SystemFrame, TextFrame
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    OutputImageRawFrame,
+    TextFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
@@ -35,38 +44,81 @@ logger.remove(0)
 logger.add(sys.stderr, level="DEBUG")
 
 
+def load_image_i420(path: str) -> Tuple[bytes, Tuple[int, int]]:
+    # Decode and convert once here. I420 (planar YUV 4:2:0) is what the video
+    # encoder consumes and it's half the size of RGB. Pillow's YCbCr is full
+    # range, so we scale it to video range while building the planes. Both the
+    # decoded and converted images are closed (and their pixel storage
+    # released) when we return.
+    with Image.open(path) as image, image.convert("RGB") as rgb_image:
+        (y, cb, cr) = rgb_image.convert("YCbCr").split()
+
+    chroma_size = ((y.width + 1) // 2, (y.height + 1) // 2)
+    y = y.point(lambda v: 16 + v * 219 // 255)
+    cb = cb.resize(chroma_size, Image.Resampling.BOX).point(lambda v: 16 + v * 224 // 255)
+    cr = cr.resize(chroma_size, Image.Resampling.BOX).point(lambda v: 16 + v * 224 // 255)
+
+    return (y.tobytes() + cb.tobytes() + cr.tobytes(), y.size)
+
+
+def load_image(path: str) -> Tuple[bytes, Tuple[int, int]]:
+    # Decoding a PNG takes tens of milliseconds, so the first run stores the
+    # decoded I420 next to it (e.g. "speaking.i420") and later runs just map
+    # that file. Opening the PNG only reads its header, we don't decode it here.
+    with Image.open(path) as image:
+        (width, height) = image.size
+    raw_path = os.path.splitext(path)[0] + ".i420"
+    raw_length = width * height + 2 * ((width + 1) // 2) * ((height + 1) // 2)
+
+    if (
+        os.path.exists(raw_path)
+        and os.path.getsize(raw_path) == raw_length
+        and os.path.getmtime(raw_path) >= os.path.getmtime(path)
+    ):
+        with open(raw_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return (bytes(m), (width, height))
+
+    (image_bytes, size) = load_image_i420(path)
+    try:
+        with open(raw_path, "wb") as f:
+            f.write(image_bytes)
+    except OSError as e:
+        logger.warning(f"Unable to cache decoded image {raw_path}: {e}")
+    return (image_bytes, size)
+
+
 class ImageSyncAggregator(FrameProcessor):
     def __init__(self, speaking_path: str, waiting_path: str):
         super().__init__()
-        self._speaking_image = Image.open(speaking_path)
-        self._speaking_image_format = self._speaking_image.format
-        self._speaking_image_bytes = self._speaking_image.tobytes()
+        # There are only two possible images, so build their frames once.
+        speaking_image, speaking_size = load_image(speaking_path)
+        self._speaking_frame = OutputImageRawFrame(
+            image=speaking_image, size=speaking_size, format="I420"
+        )
 
-        self._waiting_image = Image.open(waiting_path)
-        self._waiting_image_format = self._waiting_image.format
-        self._waiting_image_bytes = self._waiting_image.tobytes()
+        waiting_image, waiting_size = load_image(waiting_path)
+        self._waiting_frame = OutputImageRawFrame(
+            image=waiting_image, size=waiting_size, format="I420"
+        )
+
+        self._frames = {
+            BotStartedSpeakingFrame: self._speaking_frame,
+            BotStoppedSpeakingFrame: self._waiting_frame,
+        }
+        self._last_pushed_state = None
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if not isinstance(frame, SystemFrame) and direction == FrameDirection.DOWNSTREAM:
-            await self.push_frame(
-                OutputImageRawFrame(
-                    image=self._speaking_image_bytes,
-                    size=(1024, 1024),
-                    format=self._speaking_image_format,
-                )
-            )
-            await self.push_frame(frame)
-            await self.push_frame(
-                OutputImageRawFrame(
-                    image=self._waiting_image_bytes,
-                    size=(1024, 1024),
-                    format=self._waiting_image_format,
-                )
-            )
-        else:
-            await self.push_frame(frame)
+        state = type(frame)
+        image_frame = self._frames.get(state)
+        # The bot might start speaking several times in a row (e.g. once per
+        # sentence), only send the image again if it has changed.
+        if image_frame and state != self._last_pushed_state:
+            await self.push_frame(image_frame)
+            self._last_pushed_state = state
+
+        await self.push_frame(frame, direction)
 
 
 async def main():
@@ -82,6 +134,7 @@ async def main():
                 camera_out_enabled=True,
                 camera_out_width=1024,
                 camera_out_height=1024,
+                camera_out_color_format="I420",
                 transcription_enabled=True,
                 vad_enabled=True,
                 vad_analyzer=SileroVADAnalyzer(),
@@ -113,10 +166,10 @@ async def main():
         pipeline = Pipeline(
             [
                 transport.input(),
-                image_sync_aggregator,
                 context_aggregator.user(),
                 llm,
                 tts,
+                image_sync_aggregator,
                 transport.output(),
                 context_aggregator.assistant(),
             ]
@@ -6,7 +6,7 @@
 
 from pipecat.frames.frames import EndFrame, Frame, InterimTranscriptionFrame, TextFrame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
-from pipecat.utils.string import match_endofsentence
+from pipecat.utils.string import SentenceScanner
 
 
 class SentenceAggregator(FrameProcessor):
@@ -30,7 +30,7 @@ class SentenceAggregator(FrameProcessor):
 
     def __init__(self):
         super().__init__()
-        self._aggregation = ""
+        self._scanner = SentenceScanner()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
@@ -40,13 +40,11 @@ class SentenceAggregator(FrameProcessor):
             return
 
         if isinstance(frame, TextFrame):
-            self._aggregation += frame.text
-            if match_endofsentence(self._aggregation):
-                await self.push_frame(TextFrame(self._aggregation))
-                self._aggregation = ""
+            if self._scanner.feed(frame.text):
+                await self.push_frame(TextFrame(self._scanner.consume()))
         elif isinstance(frame, EndFrame):
-            if self._aggregation:
-                await self.push_frame(TextFrame(self._aggregation))
+            if self._scanner.text:
+                await self.push_frame(TextFrame(self._scanner.consume()))
             await self.push_frame(frame)
         else:
             await self.push_frame(frame, direction)
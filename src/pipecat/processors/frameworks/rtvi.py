@@ -57,7 +57,7 @@ from pipecat.processors.aggregators.openai_llm_context import (
     OpenAILLMContextFrame,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
-from pipecat.utils.string import match_endofsentence
+from pipecat.utils.string import SentenceScanner
 
 RTVI_PROTOCOL_VERSION = "0.2"
 
@@ -471,7 +471,7 @@ class RTVIUserLLMTextProcessor(RTVIFrameProcessor):
 class RTVIBotTranscriptionProcessor(RTVIFrameProcessor):
     def __init__(self):
         super().__init__()
-        self._aggregation = ""
+        self._scanner = SentenceScanner()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
@@ -481,15 +481,14 @@ class RTVIBotTranscriptionProcessor(RTVIFrameProcessor):
         if isinstance(frame, UserStartedSpeakingFrame):
             await self._push_aggregation()
         elif isinstance(frame, TextFrame):
-            self._aggregation += frame.text
-            if match_endofsentence(self._aggregation):
+            if self._scanner.feed(frame.text):
                 await self._push_aggregation()
 
     async def _push_aggregation(self):
-        if len(self._aggregation) > 0:
-            message = RTVIBotTranscriptionMessage(data=RTVITextMessageData(text=self._aggregation))
+        if len(self._scanner.text) > 0:
+            text = self._scanner.consume()
+            message = RTVIBotTranscriptionMessage(data=RTVITextMessageData(text=text))
             await self._push_transport_message_urgent(message)
-            self._aggregation = ""
 
 
 class RTVIBotLLMProcessor(RTVIFrameProcessor):
@@ -37,7 +37,7 @@ from pipecat.metrics.metrics import MetricsData
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.transcriptions.language import Language
-from pipecat.utils.string import match_endofsentence
+from pipecat.utils.string import SentenceScanner
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 from pipecat.utils.time import seconds_to_nanoseconds
 
@@ -224,7 +224,7 @@ class TTSService(AIService):
         self._stop_frame_task: Optional[asyncio.Task] = None
         self._stop_frame_queue: asyncio.Queue = asyncio.Queue()
 
-        self._current_sentence: str = ""
+        self._sentence_scanner = SentenceScanner()
 
     @property
     def sample_rate(self) -> int:
@@ -296,8 +296,7 @@ class TTSService(AIService):
         elif isinstance(frame, StartInterruptionFrame):
             await self._handle_interruption(frame, direction)
         elif isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
-            sentence = self._current_sentence
-            self._current_sentence = ""
+            sentence = self._sentence_scanner.consume()
             await self._push_tts_frames(sentence)
             if isinstance(frame, LLMFullResponseEndFrame):
                 if self._push_text_frames:
@@ -324,7 +323,7 @@ class TTSService(AIService):
             await self._stop_frame_queue.put(frame)
 
     async def _handle_interruption(self, frame: StartInterruptionFrame, direction: FrameDirection):
-        self._current_sentence = ""
+        self._sentence_scanner.consume()
         if self._text_filter:
             self._text_filter.handle_interruption()
         await self.push_frame(frame, direction)
@@ -334,11 +333,9 @@ class TTSService(AIService):
         if not self._aggregate_sentences:
             text = frame.text
         else:
-            self._current_sentence += frame.text
-            eos_end_marker = match_endofsentence(self._current_sentence)
+            eos_end_marker = self._sentence_scanner.feed(frame.text)
             if eos_end_marker:
-                text = self._current_sentence[:eos_end_marker]
-                self._current_sentence = self._current_sentence[eos_end_marker:]
+                text = self._sentence_scanner.consume(eos_end_marker)
 
         if text:
             await self._push_tts_frames(text)
@@ -7,6 +7,7 @@
 import asyncio
 from typing import AsyncGenerator
 
+import httpx
 from loguru import logger
 
 from pipecat.frames.frames import (
@@ -23,6 +24,7 @@ from pipecat.frames.frames import (
     UserStartedSpeakingFrame,
     UserStoppedSpeakingFrame,
 )
+from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import STTService, TTSService
 from pipecat.transcriptions.language import Language
 from pipecat.utils.time import time_now_iso8601
@@ -45,6 +47,9 @@ except ModuleNotFoundError as e:
     )
     raise Exception(f"Missing module: {e}")
 
+# How long a graceful stop waits for queued audio to be sent to Deepgram.
+AUDIO_QUEUE_DRAIN_TIMEOUT_SECS = 2.0
+
 
 class DeepgramTTSService(TTSService):
     def __init__(
@@ -64,10 +69,31 @@ class DeepgramTTSService(TTSService):
         }
         self.set_voice(voice)
         self._deepgram_client = DeepgramClient(api_key=api_key)
+        # The SDK creates a new HTTP client for every request and never closes
+        # it. Passing our own transport lets requests reuse connections and
+        # lets us close them when we are done.
+        self._http_transport = None
 
     def can_generate_metrics(self) -> bool:
         return True
 
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._http_transport = httpx.AsyncHTTPTransport()
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self._close_http_transport()
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self._close_http_transport()
+
+    async def _close_http_transport(self):
+        if self._http_transport:
+            await self._http_transport.aclose()
+            self._http_transport = None
+
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
         logger.debug(f"Generating TTS: [{text}]")
 
@@ -78,40 +104,58 @@ class DeepgramTTSService(TTSService):
             container="none",
         )
 
+        started = False
         try:
             await self.start_ttfb_metrics()
 
-            response = await asyncio.to_thread(
-                self._deepgram_client.speak.v("1").stream, {"text": text}, options
+            response = await self._deepgram_client.speak.asyncrest.v("1").stream_raw(
+                {"text": text}, options, transport=self._http_transport
             )
 
-            await self.start_tts_usage_metrics(text)
-            yield TTSStartedFrame()
-
-            # The response.stream_memory is already a BytesIO object
-            audio_buffer = response.stream_memory
-
-            if audio_buffer is None:
-                raise ValueError("No audio data received from Deepgram")
-
-            # Read and yield the audio data in chunks
-            audio_buffer.seek(0)  # Ensure we're at the start of the buffer
-            chunk_size = 8192  # Use a fixed buffer size
-            while True:
+            # stream_raw() doesn't raise on HTTP errors, so without this check
+            # the JSON error body would be played as audio.
+            if response.is_error:
+                await response.aread()
+                await response.aclose()
                 await self.stop_ttfb_metrics()
-                chunk = audio_buffer.read(chunk_size)
-                if not chunk:
-                    break
-                frame = TTSAudioRawFrame(
-                    audio=chunk, sample_rate=self._settings["sample_rate"], num_channels=1
+                error = (
+                    f"{self} error getting audio "
+                    f"(status: {response.status_code}, error: {response.text})"
                 )
-                yield frame
-
+                logger.error(error)
+                yield ErrorFrame(error)
+                return
+
+            try:
+                await self.start_tts_usage_metrics(text)
+                yield TTSStartedFrame()
+                started = True
+
+                # Yield audio as it arrives instead of waiting for the whole
+                # synthesis, so TTFB is Deepgram's first-byte latency.
+                first_chunk = True
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    if first_chunk:
+                        await self.stop_ttfb_metrics()
+                        first_chunk = False
+
+                    if chunk:
+                        yield TTSAudioRawFrame(
+                            audio=chunk, sample_rate=self._settings["sample_rate"], num_channels=1
+                        )
+
+                started = False
                 yield TTSStoppedFrame()
+            finally:
+                await response.aclose()
 
         except Exception as e:
             logger.exception(f"{self} exception: {e}")
             yield ErrorFrame(f"Error getting audio: {str(e)}")
+            # Make sure downstream processors always see exactly one
+            # TTSStoppedFrame for each TTSStartedFrame.
+            if started:
+                yield TTSStoppedFrame()
 
 
 class DeepgramSTTService(STTService):
@@ -121,6 +165,7 @@ class DeepgramSTTService(STTService):
         api_key: str,
         url: str = "",
         live_options: LiveOptions = None,
+        audio_queue_size: int = 100,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -157,6 +202,23 @@ class DeepgramSTTService(STTService):
             self._connection.on(LiveTranscriptionEvents.SpeechStarted, self._on_speech_started)
             self._connection.on(LiveTranscriptionEvents.UtteranceEnd, self._on_utterance_end)
 
+        # Audio is sent to Deepgram from a separate task so a stalled websocket
+        # doesn't block the pipeline. If the queue fills up we drop the oldest
+        # audio instead of letting latency grow.
+        self._audio_queue = asyncio.Queue(maxsize=audio_queue_size)
+        self._send_task = None
+
+        # Small audio frames are coalesced into ~20ms packets before being
+        # queued, so we don't pay websocket framing overhead for each of them.
+        self._audio_buffer = bytearray()
+        self._audio_packet_size = 0
+
+        # Frames we need to react to besides audio. A single lookup by type keeps
+        # the per-frame cost low for everything else.
+        self._frame_handlers = {
+            UserStoppedSpeakingFrame: self._handle_user_stopped_speaking,
+        }
+
     @property
     def vad_enabled(self):
         return self._settings["vad_events"]
@@ -183,27 +245,96 @@ class DeepgramSTTService(STTService):
 
     async def stop(self, frame: EndFrame):
         await super().stop(frame)
-        await self._disconnect()
+        await self._disconnect(send_queued_audio=True)
 
     async def cancel(self, frame: CancelFrame):
         await super().cancel(frame)
         await self._disconnect()
 
     async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
-        await self._connection.send(audio)
+        self._audio_buffer.extend(audio)
+        if len(self._audio_buffer) >= self._audio_packet_size:
+            self._flush_audio()
         yield None
 
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        handler = self._frame_handlers.get(type(frame))
+        if handler:
+            await handler(frame, direction)
+
+    async def _handle_user_stopped_speaking(self, frame: Frame, direction: FrameDirection):
+        # Don't hold back the end of the utterance waiting for a full packet.
+        self._flush_audio()
+
+    def _flush_audio(self):
+        if not self._audio_buffer:
+            return
+        audio = bytes(self._audio_buffer)
+        self._audio_buffer.clear()
+        try:
+            self._audio_queue.put_nowait(audio)
+        except asyncio.QueueFull:
+            self._audio_queue.get_nowait()
+            self._audio_queue.task_done()
+            self._audio_queue.put_nowait(audio)
+
     async def _connect(self):
+        # 20ms of 16-bit audio.
+        self._audio_packet_size = (
+            self._settings["sample_rate"] * self._settings["channels"] * 2 // 50
+        )
         if await self._connection.start(self._settings):
             logger.info(f"{self}: Connected to Deepgram")
+            self._send_task = self.get_event_loop().create_task(self._send_task_handler())
         else:
             logger.error(f"{self}: Unable to connect to Deepgram")
 
-    async def _disconnect(self):
+    async def _disconnect(self, send_queued_audio: bool = False):
+        if self._send_task:
+            if send_queued_audio:
+                # On a graceful stop, send what we still have (including a
+                # partial packet) so we don't lose the end of the last
+                # utterance (and its transcription). Don't wait forever if the
+                # websocket is stalled though.
+                self._flush_audio()
+                try:
+                    await asyncio.wait_for(
+                        self._audio_queue.join(), timeout=AUDIO_QUEUE_DRAIN_TIMEOUT_SECS
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"{self}: Timed out sending queued audio, discarding it")
+            self._send_task.cancel()
+            # The task might not have started yet, in which case awaiting it
+            # directly would raise CancelledError here.
+            await asyncio.wait([self._send_task])
+            self._send_task = None
+
+        self._audio_buffer.clear()
+        while not self._audio_queue.empty():
+            self._audio_queue.get_nowait()
+            self._audio_queue.task_done()
+
         if self._connection.is_connected:
             await self._connection.finish()
             logger.info(f"{self}: Disconnected from Deepgram")
 
+    async def _send_task_handler(self):
+        while True:
+            try:
+                audio = await self._audio_queue.get()
+            except asyncio.CancelledError:
+                break
+            try:
+                await self._connection.send(audio)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"{self} error sending audio: {e}")
+            finally:
+                self._audio_queue.task_done()
+
     async def _on_speech_started(self, *args, **kwargs):
         if self.vad_enabled:
             await self.push_frame(UserStartedSpeakingFrame())
@@ -226,10 +357,9 @@ class DeepgramSTTService(STTService):
             language = Language(language)
         if len(transcript) > 0:
             await self.stop_ttfb_metrics()
+            timestamp = time_now_iso8601()
             if is_final:
-                await self.push_frame(
-                    TranscriptionFrame(transcript, "", time_now_iso8601(), language)
-                )
+                await self.push_frame(TranscriptionFrame(transcript, "", timestamp, language))
                 if self.vad_enabled:
                     await self.push_frame(UserStoppedSpeakingFrame())
                     # Below line is really important; do not remove this as this is necessary to keep the conversation flow
@@ -244,5 +374,5 @@ class DeepgramSTTService(STTService):
                 await self.stop_processing_metrics()
             else:
                 await self.push_frame(
-                    InterimTranscriptionFrame(transcript, "", time_now_iso8601(), language)
+                    InterimTranscriptionFrame(transcript, "", timestamp, language)
                 )
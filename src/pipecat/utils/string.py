@@ -6,20 +6,99 @@
 
 import re
 
-ENDOFSENTENCE_PATTERN_STR = r"""
-    (?<![A-Z])       # Negative lookbehind: not preceded by an uppercase letter (e.g., "U.S.A.")
-    (?<!\d)          # Negative lookbehind: not preceded by a digit (e.g., "1. Let's start")
-    (?<!\d\s[ap])    # Negative lookbehind: not preceded by time (e.g., "3:00 a.m.")
-    (?<!Mr|Ms|Dr)    # Negative lookbehind: not preceded by Mr, Ms, Dr (combined bc. length is the same)
-    (?<!Mrs)         # Negative lookbehind: not preceded by "Mrs"
-    (?<!Prof)        # Negative lookbehind: not preceded by "Prof"
-    [\.\?\!:;]|      # Match a period, question mark, exclamation point, colon, or semicolon
-    [。？！：；]       # the full-width version (mainly used in East Asian languages such as Chinese)
-    $                # End of string
-"""
-ENDOFSENTENCE_PATTERN = re.compile(ENDOFSENTENCE_PATTERN_STR, re.VERBOSE)
+# Sentence terminators, shared by all the patterns below so they can't drift
+# apart.
+ENDOFSENTENCE_TERMINATORS = r"\.\?\!:;"
+ENDOFSENTENCE_FULLWIDTH_TERMINATORS = "。？！：；"
 
+ENDOFSENTENCE_PATTERN_STR = (
+    r"(?<![A-Z])"  # Negative lookbehind: not preceded by an uppercase letter (e.g., "U.S.A.")
+    r"(?<!\d)"  # Negative lookbehind: not preceded by a digit (e.g., "1. Let's start")
+    r"(?<!\d\s[ap])"  # Negative lookbehind: not preceded by time (e.g., "3:00 a.m.")
+    r"(?<!Mr)(?<!Ms)(?<!Dr)"  # Negative lookbehind: not preceded by Mr, Ms, Dr
+    r"(?<!Mrs)"  # Negative lookbehind: not preceded by "Mrs"
+    r"(?<!Prof)"  # Negative lookbehind: not preceded by "Prof"
+    rf"[{ENDOFSENTENCE_TERMINATORS}]|"  # Match a period, question mark, exclamation point, colon, or semicolon
+    rf"[{ENDOFSENTENCE_FULLWIDTH_TERMINATORS}]"  # the full-width version (mainly used in East Asian languages such as Chinese)
+    r"$"  # End of string
+)
+ENDOFSENTENCE_PATTERN = re.compile(ENDOFSENTENCE_PATTERN_STR)
 
-def match_endofsentence(text: str) -> int:
-    match = ENDOFSENTENCE_PATTERN.search(text.rstrip())
+# Plain character class with no lookbehinds. Most streamed chunks don't contain
+# any terminator at all, so we can reject them with a single linear scan before
+# running the full pattern above. When there is a terminator, the full pattern
+# only needs to start from there (lookbehinds still see the preceding text).
+ENDOFSENTENCE_TERMINATOR_PATTERN = re.compile(
+    f"[{ENDOFSENTENCE_TERMINATORS}{ENDOFSENTENCE_FULLWIDTH_TERMINATORS}]"
+)
+
+
+def _match_endofsentence(text: str, pos: int = 0) -> int:
+    candidate = ENDOFSENTENCE_TERMINATOR_PATTERN.search(text, pos)
+    if not candidate:
+        return 0
+    match = ENDOFSENTENCE_PATTERN.search(text, candidate.start())
     return match.end() if match else 0
+
+
+def match_endofsentence(text: str) -> int:
+    return _match_endofsentence(text.rstrip())
+
+
+class SentenceScanner:
+    """Finds the end of a sentence in text that arrives in chunks (e.g. streamed
+    LLM tokens). Only the newly appended text is scanned on each call, so
+    accumulating a long sentence is linear instead of quadratic.
+
+    >>> scanner = SentenceScanner()
+    >>> scanner.feed("Hello,")
+    0
+    >>> scanner.feed(" world.")
+    13
+    >>> scanner.consume(13)
+    'Hello, world.'
+
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._scanned_len = 0
+        # Whether the whole buffer has been scanned without finding a sentence
+        # end. If so, a new chunk without terminators can't complete one.
+        self._fully_scanned = True
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def feed(self, text: str) -> int:
+        """Appends text and returns the end of the first sentence in the
+        accumulated text (same as `match_endofsentence()`), or 0 if there is
+        none yet.
+
+        """
+        self._text += text
+        if self._fully_scanned and not ENDOFSENTENCE_TERMINATOR_PATTERN.search(text):
+            return 0
+        stripped = self._text.rstrip()
+        end = _match_endofsentence(stripped, self._scanned_len)
+        if not end:
+            # Nothing before this point can start a sentence end anymore: there
+            # are no lookaheads and full-width terminators only match at the
+            # very end.
+            self._scanned_len = len(stripped)
+        self._fully_scanned = not end
+        return end
+
+    def consume(self, end: int | None = None) -> str:
+        """Removes and returns the accumulated text up to `end`, or all of it if
+        `end` is not given.
+
+        """
+        if end is None:
+            end = len(self._text)
+        text = self._text[:end]
+        self._text = self._text[end:]
+        self._scanned_len = 0
+        self._fully_scanned = not self._text
+        return text
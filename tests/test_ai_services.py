@@ -2,8 +2,9 @@ import unittest
 
 from typing import AsyncGenerator
 
-from pipecat.services.ai_services import AIService, match_endofsentence
+from pipecat.services.ai_services import AIService
 from pipecat.frames.frames import EndFrame, Frame, TextFrame
+from pipecat.utils.string import SentenceScanner, match_endofsentence
 
 
 class SimpleAIService(AIService):
@@ -40,6 +41,9 @@ class TestBaseAIService(unittest.IsolatedAsyncioTestCase):
         assert not match_endofsentence("Heute ist Dienstag, der 3.")  # 3. Juli 2024
         assert not match_endofsentence("America, or the U.")  # U.S.A.
         assert not match_endofsentence("It still early, it's 3:00 a.")  # 3:00 a.m.
+        # The sentence doesn't need to be at the end of the text.
+        assert match_endofsentence('He said "Hello."') == 15
+        assert match_endofsentence("Hello. How are") == 6
 
     async def test_endofsentence_zh(self):
         chinese_sentences = [
@@ -53,6 +57,21 @@ class TestBaseAIService(unittest.IsolatedAsyncioTestCase):
             assert match_endofsentence(i)
         assert not match_endofsentence("你好，")
 
+    async def test_sentence_scanner(self):
+        scanner = SentenceScanner()
+        assert not scanner.feed("Ok, Mr")
+        assert not scanner.feed(". Smith")
+        assert not scanner.feed(" it's 3:00 a")
+        assert not scanner.feed(". ")
+        eos = scanner.feed("Bye. Next")
+        assert eos
+        assert scanner.consume(eos) == "Ok, Mr. Smith it's 3:00 a. Bye."
+        assert scanner.text == " Next"
+        assert not scanner.feed(" 你好。世界")
+        assert scanner.feed("！")
+        assert scanner.consume() == " Next 你好。世界！"
+        assert scanner.text == ""
+
 
 if __name__ == "__main__":
     unittest.main()
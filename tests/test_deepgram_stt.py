@@ -0,0 +1,127 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pipecat.clocks.system_clock import SystemClock
+from pipecat.frames.frames import CancelFrame, EndFrame, StartFrame
+from pipecat.services.deepgram import DeepgramSTTService
+
+
+class FakeConnection:
+    def __init__(self, connected: bool = True):
+        self.is_connected = False
+        self.sent = []
+        self._connected = connected
+        self._can_send = asyncio.Event()
+        self._can_send.set()
+
+    async def start(self, options):
+        self.is_connected = self._connected
+        return self._connected
+
+    async def send(self, data):
+        await self._can_send.wait()
+        self.sent.append(data)
+        return True
+
+    async def finish(self):
+        self.is_connected = False
+
+
+async def send_audio(stt: DeepgramSTTService, audio: bytes):
+    async for _ in stt.run_stt(audio):
+        pass
+
+
+class TestDeepgramSTTService(unittest.IsolatedAsyncioTestCase):
+    async def test_stop_sends_queued_audio(self):
+        stt = DeepgramSTTService(api_key="fake")
+        stt._connection = FakeConnection()
+        await stt.start(StartFrame(clock=SystemClock()))
+
+        # Hold the websocket so audio piles up in the queue.
+        stt._connection._can_send.clear()
+        for _ in range(10):
+            await send_audio(stt, b"\x01" * 640)
+        stt._connection._can_send.set()
+
+        await stt.stop(EndFrame())
+
+        self.assertEqual(b"".join(stt._connection.sent), b"\x01" * 640 * 10)
+        self.assertFalse(stt._connection.is_connected)
+
+    async def test_stop_sends_partial_packet(self):
+        stt = DeepgramSTTService(api_key="fake")
+        stt._connection = FakeConnection()
+        await stt.start(StartFrame(clock=SystemClock()))
+
+        # 20ms at 16kHz is 640 bytes, so this stays buffered.
+        await send_audio(stt, b"\x01" * 320)
+        await asyncio.sleep(0)
+        self.assertEqual(stt._connection.sent, [])
+
+        await stt.stop(EndFrame())
+
+        self.assertEqual(stt._connection.sent, [b"\x01" * 320])
+
+    async def test_stop_with_stalled_connection(self):
+        stt = DeepgramSTTService(api_key="fake")
+        stt._connection = FakeConnection()
+        await stt.start(StartFrame(clock=SystemClock()))
+
+        stt._connection._can_send.clear()
+        for _ in range(3):
+            await send_audio(stt, b"\x01" * 640)
+
+        with patch("pipecat.services.deepgram.AUDIO_QUEUE_DRAIN_TIMEOUT_SECS", 0.1):
+            await stt.stop(EndFrame())
+
+        self.assertEqual(stt._connection.sent, [])
+        self.assertTrue(stt._audio_queue.empty())
+        self.assertFalse(stt._connection.is_connected)
+
+    async def test_full_queue_keeps_newest_audio(self):
+        stt = DeepgramSTTService(api_key="fake", audio_queue_size=2)
+        stt._connection = FakeConnection()
+        await stt.start(StartFrame(clock=SystemClock()))
+        stt._connection._can_send.clear()
+
+        # Let the first packet reach the (blocked) websocket, then overflow the
+        # queue with the rest.
+        await asyncio.sleep(0)
+        await send_audio(stt, b"\x01" * 640)
+        await asyncio.sleep(0)
+        for i in range(2, 6):
+            await send_audio(stt, bytes([i]) * 640)
+
+        stt._connection._can_send.set()
+        await stt.stop(EndFrame())
+
+        self.assertEqual(stt._connection.sent, [bytes([i]) * 640 for i in (1, 4, 5)])
+
+    async def test_cancel_discards_queued_audio(self):
+        stt = DeepgramSTTService(api_key="fake")
+        stt._connection = FakeConnection()
+        await stt.start(StartFrame(clock=SystemClock()))
+
+        stt._connection._can_send.clear()
+        for _ in range(10):
+            await send_audio(stt, b"\x01" * 640)
+
+        await stt.cancel(CancelFrame())
+
+        self.assertEqual(stt._connection.sent, [])
+        self.assertTrue(stt._audio_queue.empty())
+
+    async def test_no_send_task_without_connection(self):
+        stt = DeepgramSTTService(api_key="fake")
+        stt._connection = FakeConnection(connected=False)
+        await stt.start(StartFrame(clock=SystemClock()))
+
+        self.assertIsNone(stt._send_task)
+
+        await stt.stop(EndFrame())
+
+
+if __name__ == "__main__":
+    unittest.main()
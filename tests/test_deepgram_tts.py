@@ -0,0 +1,97 @@
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+
+from pipecat.clocks.system_clock import SystemClock
+from pipecat.frames.frames import (
+    EndFrame,
+    ErrorFrame,
+    StartFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.services.deepgram import DeepgramTTSService
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.is_error = status_code >= 400
+        self.text = content.decode()
+        self.closed = False
+        self._content = content
+
+    async def aread(self):
+        return self._content
+
+    async def aclose(self):
+        self.closed = True
+
+    async def aiter_bytes(self, chunk_size: int):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i : i + chunk_size]
+
+
+def fake_deepgram_client(response: FakeResponse):
+    async def stream_raw(source, options, **kwargs):
+        rest.requests.append(kwargs)
+        return response
+
+    rest = SimpleNamespace(stream_raw=stream_raw, requests=[])
+    return SimpleNamespace(speak=SimpleNamespace(asyncrest=SimpleNamespace(v=lambda _: rest)))
+
+
+class TestDeepgramTTSService(unittest.IsolatedAsyncioTestCase):
+    async def test_run_tts(self):
+        tts = DeepgramTTSService(api_key="fake")
+        response = FakeResponse(200, b"\x00\x01" * 8192)
+        tts._deepgram_client = fake_deepgram_client(response)
+
+        frames = [frame async for frame in tts.run_tts("Hello")]
+
+        self.assertIsInstance(frames[0], TTSStartedFrame)
+        self.assertTrue(all(isinstance(f, TTSAudioRawFrame) for f in frames[1:-1]))
+        self.assertEqual(b"".join(f.audio for f in frames[1:-1]), b"\x00\x01" * 8192)
+        self.assertIsInstance(frames[-1], TTSStoppedFrame)
+        self.assertTrue(response.closed)
+
+    async def test_run_tts_http_error(self):
+        tts = DeepgramTTSService(api_key="fake")
+        response = FakeResponse(401, b'{"err_code": "INVALID_AUTH"}')
+        tts._deepgram_client = fake_deepgram_client(response)
+
+        with patch.object(tts, "stop_ttfb_metrics") as stop_ttfb_metrics:
+            frames = [frame async for frame in tts.run_tts("Hello")]
+            stop_ttfb_metrics.assert_awaited_once()
+
+        self.assertEqual(len(frames), 1)
+        self.assertIsInstance(frames[0], ErrorFrame)
+        self.assertIn("401", frames[0].error)
+        self.assertIn("INVALID_AUTH", frames[0].error)
+        self.assertTrue(response.closed)
+
+    async def test_http_transport_reused_and_closed(self):
+        tts = DeepgramTTSService(api_key="fake")
+        tts._deepgram_client = fake_deepgram_client(FakeResponse(200, b"\x00\x01"))
+        await tts.start(StartFrame(clock=SystemClock()))
+        transport = tts._http_transport
+        self.assertIsInstance(transport, httpx.AsyncHTTPTransport)
+
+        for _ in range(2):
+            [frame async for frame in tts.run_tts("Hello")]
+
+        requests = tts._deepgram_client.speak.asyncrest.v("1").requests
+        self.assertEqual([r["transport"] for r in requests], [transport, transport])
+
+        with patch.object(transport, "aclose", wraps=transport.aclose) as aclose:
+            await tts.stop(EndFrame())
+            aclose.assert_awaited_once()
+        self.assertIsNone(tts._http_transport)
+
+
+if __name__ == "__main__":
+    unittest.main()